@@ -3,8 +3,32 @@
 import json
 import re
 import sys
-from dataclasses import dataclass
-from typing import List, Union, Dict, Any
+
+# Optional regex engines, probed below once the patterns are defined.
+# An ImportError guard alone is not enough: google-re2 (the current
+# provider of the `re2` module name) imports cleanly but exposes no flag
+# constants and takes an Options object instead of int flags, so it can
+# only be validated by compiling the actual patterns.
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+try:
+    import regex as _regex
+except ImportError:
+    _regex = None
+from typing import List, Tuple, Union, Dict, Any
+
+# Optional numba acceleration: long comma-separated runs of FLOAT tokens
+# inside arrays are converted in one compiled pass instead of a Python
+# loop with one float() call per element. Purely optional; without numba
+# the general path is used.
+try:
+    import numpy as _np
+    from numba import njit as _njit
+except ImportError:
+    _np = None
+    _njit = None
 
 # Token types and their corresponding regex patterns
 TOKEN_SPECIFICATION = [
@@ -19,29 +43,101 @@ TOKEN_SPECIFICATION = [
     ('LBRACKET', r'\['),  # [
     ('RBRACKET', r'\]'),  # ]
     ('STRING', r'"(?:\\.|[^"\\])*"'),  # "string"
-    ('NUMBER', r'-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?'),  # number
+    ('FLOAT', r'-?\d+(?:\.\d+(?:[eE][+-]?\d+)?|[eE][+-]?\d+)'),  # number with decimal/exponent
+    ('INT', r'-?\d+'),  # integer
     ('OPERATOR', r'[+\-*/%]|==|!=|<=|>=|<|>'),  # operators
     ('TRUE', r'\btrue\b'),  # true
     ('FALSE', r'\bfalse\b'),  # false
     ('NULL', r'\bnull\b'),  # null
     ('IDENTIFIER', r'[A-Za-z_][A-Za-z0-9_]*'),  # identifiers
-    ('WS', r'\s+'),  # whitespace (includes newlines)
-    ('COMMENT', r'//.*?$|/\*.*?\*/'),  # comments
 ]
 
-# Compile the combined regex pattern for tokenization
-TOKEN_REGEX = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in TOKEN_SPECIFICATION)
-TOKEN_PATTERN = re.compile(TOKEN_REGEX, re.DOTALL | re.MULTILINE)
+# Interned token-type constants: the lexer interns every type it emits,
+# so the parser can compare types with `is` (pointer equality) instead
+# of full string comparison.
+_AT_KEYWORD = sys.intern('AT_KEYWORD')
+_COLON = sys.intern('COLON')
+_COMMA = sys.intern('COMMA')
+_LBRACE = sys.intern('LBRACE')
+_RBRACE = sys.intern('RBRACE')
+_LBRACKET = sys.intern('LBRACKET')
+_RBRACKET = sys.intern('RBRACKET')
+_STRING = sys.intern('STRING')
+_IDENTIFIER = sys.intern('IDENTIFIER')
+_FLOAT = sys.intern('FLOAT')
+
+# Whitespace and comments are skipped separately so they never reach the
+# token loop at all
+SKIP_REGEX = r'(?:\s+|//[^\n]*|/\*.*?\*/)+'
+
+# Combined regex pattern for tokenization. The alternatives are plain
+# positional groups: match.lastindex is a cheap index into TOKEN_NAMES,
+# whereas named groups pay a dict lookup in match.lastgroup per token.
+TOKEN_REGEX = '|'.join(f'({pattern})' for name, pattern in TOKEN_SPECIFICATION)
+TOKEN_NAMES = tuple(sys.intern(name) for name, pattern in TOKEN_SPECIFICATION)
+
+# Bytes-mode variant of the combined pattern. \w is ASCII-only against
+# bytes while the str pattern matched Unicode word characters in
+# @keywords, so '@héllo' would split apart. Bytes >= 0x80 occur only
+# inside the multi-byte UTF-8 sequences of non-ASCII characters, so
+# admitting them into the keyword class keeps such keywords whole;
+# parse_key decodes the UTF-8 back out.
+TOKEN_REGEX_B = TOKEN_REGEX.replace(r'@\w+', r'@[\w\x80-\xff]+').encode('ascii')
 
-@dataclass
-class Token:
-    """Class representing a single token."""
-    type: str
-    value: str
-    position: int
+def _compile_patterns(engine):
+    """Compile the lexer's patterns (str and bytes) with `engine`.
 
-    def __repr__(self):
-        return f'Token({self.type}, {self.value}, pos={self.position})'
+    Raising here means the engine cannot host these patterns and the
+    caller should try the next candidate.
+    """
+    flags = engine.DOTALL | engine.MULTILINE
+    return (engine.compile(SKIP_REGEX, engine.DOTALL),
+            engine.compile(TOKEN_REGEX, flags),
+            # Bytes-mode twins: the token alphabet is ASCII, so scanning
+            # the UTF-8 encoding of the input avoids the wider
+            # per-character cost of matching on str; string payloads are
+            # decoded lazily
+            engine.compile(SKIP_REGEX.encode('ascii'), engine.DOTALL),
+            engine.compile(TOKEN_REGEX_B, flags))
+
+# Pick the best available regex engine by compiling the real patterns
+# with each candidate and keeping the first that succeeds. Preferred is
+# re2: a DFA with guaranteed linear-time matching, so adversarial input
+# (say an unterminated string full of backslashes) cannot trigger the
+# backtracking blowups an NFA engine allows; it fails the probe when the
+# installed module is google-re2, whose compile() API differs. Next is
+# the third-party `regex` module, whose internal optimizer handles large
+# alternations like TOKEN_PATTERN well. The stdlib `re` always compiles
+# these patterns, so the loop cannot fall off the end.
+for _engine in (_re2, _regex, re):
+    if _engine is None:
+        continue
+    try:
+        (SKIP_PATTERN, TOKEN_PATTERN,
+         SKIP_PATTERN_B, TOKEN_PATTERN_B) = _compile_patterns(_engine)
+    except Exception:
+        continue
+    break
+del _engine
+
+# Bind the match methods once at import: each lex call then starts from
+# a plain global load instead of two pattern-attribute lookups
+_SKIP_MATCH_B = SKIP_PATTERN_B.match
+_TOKEN_MATCH_B = TOKEN_PATTERN_B.match
+
+# Structural characters are always exactly one byte and one token, so
+# the scan loop classifies them with a 256-entry table lookup instead of
+# running the full token alternation. simdjson-style: structural bytes
+# are the cheap, common skeleton of the input.
+_STRUCTURAL_TYPES: List[Any] = [None] * 256
+_STRUCTURAL_VALUES: List[Any] = [None] * 256
+for _name, _byte in (('COLON', b':'), ('COMMA', b','), ('DOT', b'.'),
+                     ('LPAREN', b'('), ('RPAREN', b')'),
+                     ('LBRACE', b'{'), ('RBRACE', b'}'),
+                     ('LBRACKET', b'['), ('RBRACKET', b']')):
+    _STRUCTURAL_TYPES[_byte[0]] = sys.intern(_name)
+    _STRUCTURAL_VALUES[_byte[0]] = _byte
+del _name, _byte
 
 class Lexer:
     """Lexer for tokenizing DML input text."""
@@ -49,188 +145,624 @@ class Lexer:
     def __init__(self, input_text: str):
         self.input_text = input_text
 
-    def tokenize(self) -> List[Token]:
-        """Tokenize the input text into a list of tokens."""
-        tokens = []
-        for match in TOKEN_PATTERN.finditer(self.input_text):
-            token_type = match.lastgroup
-            token_value = match.group()
-            token_pos = match.start()
-            if token_type in ('WS', 'COMMENT'):
-                continue  # Ignore whitespace and comments
-            tokens.append(Token(token_type, token_value, token_pos))
-        return tokens
+    def tokenize(self) -> Tuple[List[str], List[bytes], List[int]]:
+        """Tokenize the input text into parallel type/value/position lists.
+
+        A struct-of-arrays layout avoids allocating a token object per
+        match, which dominates lexing time on large inputs. Scanning runs
+        over the UTF-8 encoding of the input, so values are bytes and
+        positions are byte offsets; the parser decodes string payloads
+        lazily.
+        """
+        types: List[str] = []
+        values: List[bytes] = []
+        positions: List[int] = []
+        self.buffer = self.input_text.encode('utf-8')
+        _tokenize_into(self.buffer, 0, types, values, positions)
+        return types, values, positions
+
+def _tokenize_into(buf: bytes, pos: int,
+                   types: List[str], values: List[bytes],
+                   positions: List[int]) -> Union[int, None]:
+    """Scan buf from pos onward, appending tokens to the parallel lists.
+
+    Returns the offset of the first byte no token rule matched, or None.
+    Such a byte may be the start of a token that is still incomplete (an
+    unterminated string, a lone '@'), which incremental parsing needs to
+    know about.
+    """
+    n = len(buf)
+    # Preallocate from a size estimate and write by index, so the lists
+    # are not repeatedly reallocated and copied as they grow; the rare
+    # token-denser-than-estimated input falls back to append
+    idx = len(types)
+    estimate = (n - pos) // 4 + 8
+    types.extend([None] * estimate)
+    values.extend([None] * estimate)
+    positions.extend([0] * estimate)
+    capacity = idx + estimate
+    skip_match = _SKIP_MATCH_B
+    token_match = _TOKEN_MATCH_B
+    names = TOKEN_NAMES
+    structural_types = _STRUCTURAL_TYPES
+    structural_values = _STRUCTURAL_VALUES
+    first_skipped = None
+    while pos < n:
+        match = skip_match(buf, pos)
+        if match:
+            pos = match.end()
+            if pos >= n:
+                break
+        byte = buf[pos]
+        token_type = structural_types[byte]
+        if token_type is not None:
+            value = structural_values[byte]
+            start = pos
+            pos += 1
+        else:
+            match = token_match(buf, pos)
+            if match is None:
+                if first_skipped is None:
+                    first_skipped = pos
+                pos += 1  # Skip characters no token rule matches
+                continue
+            token_type = names[match.lastindex - 1]
+            value = match.group()
+            start = pos
+            pos = match.end()
+        if idx < capacity:
+            types[idx] = token_type
+            values[idx] = value
+            positions[idx] = start
+        else:
+            types.append(token_type)
+            values.append(value)
+            positions.append(start)
+        idx += 1
+    del types[idx:], values[idx:], positions[idx:]
+    return first_skipped
+
+# Constant token types and the Python singletons they parse to
+_CONSTANTS = {'TRUE': True, 'FALSE': False, 'NULL': None}
+
+# Token types that terminate an expression
+_EXPRESSION_STOP = frozenset(('COMMA', 'RBRACE', 'RBRACKET'))
+
+# Minimum run length before the compiled float scanner is worth the
+# bookkeeping around it
+_BULK_FLOAT_MIN = 16
+
+def _scan_floats(buf, out):
+    """Parse whitespace/comma-separated floats from a uint8 buffer.
+
+    Fills `out` and returns (count, ok). ok is False when the span holds
+    anything but separators and well-formed numbers, or when a mantissa
+    has too many digits for exact int64 accumulation; callers then fall
+    back to the general path. Results can differ from float() in the
+    last ulp because the exponent is applied as a power-of-ten multiply.
+    """
+    n = buf.shape[0]
+    limit = out.shape[0]
+    i = 0
+    k = 0
+    while i < n:
+        c = buf[i]
+        if c == 32 or c == 44 or c == 10 or c == 9 or c == 13:
+            i += 1
+            continue
+        if c != 45 and not 48 <= c <= 57:
+            # Not a separator and not the start of a number: bail out
+            # rather than spin on a byte no branch below consumes
+            return k, False
+        negative = False
+        if c == 45:  # '-'
+            negative = True
+            i += 1
+        mantissa = 0
+        digits = 0
+        while i < n and 48 <= buf[i] <= 57:
+            mantissa = mantissa * 10 + (buf[i] - 48)
+            digits += 1
+            i += 1
+        exponent = 0
+        if i < n and buf[i] == 46:  # '.'
+            i += 1
+            while i < n and 48 <= buf[i] <= 57:
+                mantissa = mantissa * 10 + (buf[i] - 48)
+                exponent -= 1
+                digits += 1
+                i += 1
+        if digits == 0 or digits > 18:
+            return k, False
+        if i < n and (buf[i] == 101 or buf[i] == 69):  # 'e' / 'E'
+            i += 1
+            exponent_sign = 1
+            if i < n and (buf[i] == 43 or buf[i] == 45):
+                if buf[i] == 45:
+                    exponent_sign = -1
+                i += 1
+            explicit = 0
+            while i < n and 48 <= buf[i] <= 57:
+                explicit = explicit * 10 + (buf[i] - 48)
+                i += 1
+            exponent += exponent_sign * explicit
+        if k >= limit:
+            return k, False
+        value = mantissa * (10.0 ** exponent)
+        out[k] = -value if negative else value
+        k += 1
+    return k, True
+
+if _njit is not None:
+    _scan_floats = _njit(cache=True)(_scan_floats)
+
+class _EndOfInput(SyntaxError):
+    """Internal: the token stream ended where the grammar needed more."""
+
+class _Suspended(Exception):
+    """Internal: an incremental parse ran out of tokens inside a container."""
+
+    def __init__(self, root, stack):
+        self.root = root
+        self.stack = stack
+
+# Token types that appended text could still grow ('12' -> '123',
+# 'tru' -> 'true') or merge with what follows into a different token
+# ('1' '.' -> '1.5', '1.5' 'e' -> '1.5e-3'); DOT is in the set for the
+# merge case only
+_EXTENDABLE_TYPES = frozenset((
+    'AT_KEYWORD', 'IDENTIFIER', 'INT', 'FLOAT', 'OPERATOR',
+    'TRUE', 'FALSE', 'NULL', 'DOT',
+))
 
 class Parser:
     """Parser for DML tokens."""
 
-    def __init__(self, tokens: List[Token]):
-        self.tokens = tokens
+    def __init__(self, types: List[str], values: List[bytes], positions: List[int],
+                 buffer: bytes = None, incremental: bool = False):
+        self.types = types
+        self.values = values
+        self.positions = positions
+        self.buffer = buffer
         self.pos = 0
+        self._incremental = incremental
+        self._bulk_floats = _njit is not None and buffer is not None
+        # Start position -> (result, end position) for parse_expression,
+        # so re-entry at an already parsed span is O(1)
+        self._expr_memo: Dict[int, Tuple[str, int]] = {}
+        # Token type -> handler, looked up once per value instead of a
+        # chain of string comparisons
+        self._value_dispatch = {
+            'STRING': self.parse_string,
+            'INT': self.parse_int,
+            'FLOAT': self.parse_float,
+        }
 
     def parse(self) -> Any:
-        """Parse the token list and return the resulting DML structure."""
-        if self.pos >= len(self.tokens):
+        """Parse the token stream and return the resulting DML structure."""
+        if self.pos >= len(self.types):
             raise SyntaxError("No tokens to parse")
-        token = self.current_token()
-        if token.type == 'LBRACE':
+        if self.types[self.pos] is _LBRACE:
             # Parse a JSON object
-            return self.parse_object()
+            return self._parse_container()
         else:
             # Parse top-level key-value pairs
             dml_sections = {}
-            while self.pos < len(self.tokens):
-                token = self.current_token()
-                if token.type in ('AT_KEYWORD', 'IDENTIFIER'):
-                    key = token.value
-                    self.consume_token()
-                    if self.current_token().type == 'COLON':
-                        self.consume_token('COLON')
+            while self.pos < len(self.types):
+                token_type = self.types[self.pos]
+                if token_type is _AT_KEYWORD or token_type is _IDENTIFIER:
+                    key = self.values[self.pos].decode('utf-8')
+                    self.pos += 1
+                    if self.pos < len(self.types) and self.types[self.pos] is _COLON:
+                        self.pos += 1
                         value = self.parse_value()
                         dml_sections[key] = value
                     else:
                         raise SyntaxError(
-                            f"Expected ':' after key '{key}', but got {self.current_token().type} at position {self.current_token().position}")
+                            f"Expected ':' after key '{key}', but got {self._describe_current()}")
                 else:
-                    raise SyntaxError(f"Unexpected token {token.type} at position {token.position}")
+                    raise SyntaxError(
+                        f"Unexpected token {token_type} at position {self.positions[self.pos]}")
             return dml_sections
 
     def parse_value(self) -> Any:
         """Parse a value."""
-        token = self.current_token()
-        if token.type == 'LBRACE':
-            return self.parse_object()
-        elif token.type == 'LBRACKET':
-            return self.parse_array()
-        elif token.type == 'STRING':
-            return self.parse_string()
-        elif token.type == 'NUMBER':
-            return self.parse_number()
-        elif token.type in ('TRUE', 'FALSE', 'NULL'):
-            return self.parse_constant()
-        else:
-            return self.parse_expression()
-
-    def parse_object(self) -> Dict[str, Any]:
-        """Parse an object."""
-        obj = {}
-        self.consume_token('LBRACE')
-        while True:
-            token = self.current_token()
-            if token.type == 'RBRACE':
-                break
-            key = self.parse_key()
-            self.consume_token('COLON')
-            value = self.parse_value()
-            obj[key] = value
-            token = self.current_token()
-            if token.type == 'COMMA':
-                self.consume_token('COMMA')
-            elif token.type == 'RBRACE':
-                break
+        token_type = self._current_type()
+        if token_type is _LBRACE or token_type is _LBRACKET:
+            return self._parse_container()
+        return self._parse_scalar(token_type)
+
+    def _parse_scalar(self, token_type: str) -> Any:
+        """Parse a non-container value whose token type is already known."""
+        if token_type in _CONSTANTS:
+            self.pos += 1
+            return _CONSTANTS[token_type]
+        handler = self._value_dispatch.get(token_type)
+        if handler is not None:
+            return handler()
+        result = self.parse_expression()
+        if self._incremental and self.pos >= len(self.types):
+            # The expression ran to the end of the input; appended text
+            # could still extend it, so treat it as incomplete
+            raise _EndOfInput("Unexpected end of input")
+        return result
+
+    def _try_bulk_floats(self, container: List[Any]) -> bool:
+        """Bulk-convert a run of FLOAT array elements with the compiled scanner.
+
+        Returns True and advances past the run when it succeeds; False
+        leaves the position untouched so the caller parses normally.
+        """
+        types = self.types
+        n = len(types)
+        scan = self.pos
+        last = scan
+        count = 0
+        while scan < n and types[scan] is _FLOAT:
+            last = scan
+            count += 1
+            scan += 1
+            if scan < n and types[scan] is _COMMA:
+                scan += 1
             else:
-                raise SyntaxError(f"Expected ',' or '}}', but got {token.type} at position {token.position}")
-        self.consume_token('RBRACE')
-        return obj
-
-    def parse_array(self) -> List[Any]:
-        """Parse an array."""
-        array = []
-        self.consume_token('LBRACKET')
-        while True:
-            token = self.current_token()
-            if token.type == 'RBRACKET':
                 break
-            value = self.parse_value()
-            array.append(value)
-            token = self.current_token()
-            if token.type == 'COMMA':
-                self.consume_token('COMMA')
-            elif token.type == 'RBRACKET':
-                break
-            else:
-                raise SyntaxError(f"Expected ',' or ']', but got {token.type} at position {token.position}")
-        self.consume_token('RBRACKET')
-        return array
+        if count < _BULK_FLOAT_MIN:
+            return False
+        start = self.positions[self.pos]
+        end = self.positions[last] + len(self.values[last])
+        segment = self.buffer[start:end]
+        if b'/' in segment:
+            # A comment inside the run; let the general path handle it
+            return False
+        out = _np.empty(count, dtype=_np.float64)
+        parsed, ok = _scan_floats(_np.frombuffer(segment, dtype=_np.uint8), out)
+        if not ok or parsed != count:
+            return False
+        container.extend(out.tolist())
+        self.pos = last + 1
+        return True
+
+    def _parse_container(self, stack: List[List[Any]] = None) -> Union[Dict[str, Any], List[Any]]:
+        """Parse nested objects and arrays iteratively.
+
+        An explicit stack of open containers replaces recursion, so deep
+        nesting costs neither a Python frame per level nor a
+        recursion-limit crash. Each child container is attached to its
+        parent when it is opened; popping a frame just closes it.
+
+        In incremental mode, running out of tokens rewinds to the start
+        of the unfinished item and raises _Suspended carrying the stack;
+        passing that stack back in resumes where the parse left off.
+        """
+        positions = self.positions
+        if stack is None:
+            root: Union[Dict[str, Any], List[Any]] = {} if self.types[self.pos] is _LBRACE else []
+            self.pos += 1
+            # Each frame is [container, True once it holds at least one item]
+            stack = [[root, False]]
+        else:
+            root = stack[0][0]
+        incremental = self._incremental
+        while stack:
+            item_start = self.pos
+            frame = stack[-1]
+            had_item = frame[1]
+            try:
+                container = frame[0]
+                if type(container) is dict:
+                    closer, delimiters = _RBRACE, "',' or '}'"
+                else:
+                    closer, delimiters = _RBRACKET, "',' or ']'"
+                token_type = self._current_type()
+                if token_type is closer:
+                    self.pos += 1
+                    stack.pop()
+                    continue
+                if frame[1]:
+                    if token_type is not _COMMA:
+                        raise SyntaxError(
+                            f"Expected {delimiters}, but got {token_type} at position {positions[self.pos]}")
+                    self.pos += 1
+                    if self._current_type() is closer:
+                        self.pos += 1
+                        stack.pop()
+                        continue
+                frame[1] = True
+                if type(container) is dict:
+                    key = self.parse_key()
+                    if self._current_type() is not _COLON:
+                        raise SyntaxError(
+                            f"Expected COLON, but got {self.types[self.pos]} at position {positions[self.pos]}")
+                    self.pos += 1
+                    token_type = self._current_type()
+                    if token_type is _LBRACE or token_type is _LBRACKET:
+                        child: Union[Dict[str, Any], List[Any]] = {} if token_type is _LBRACE else []
+                        self.pos += 1
+                        container[key] = child
+                        stack.append([child, False])
+                    else:
+                        container[key] = self._parse_scalar(token_type)
+                else:
+                    token_type = self._current_type()
+                    if token_type is _LBRACE or token_type is _LBRACKET:
+                        child = {} if token_type is _LBRACE else []
+                        self.pos += 1
+                        container.append(child)
+                        stack.append([child, False])
+                    elif (token_type is _FLOAT and self._bulk_floats
+                            and self._try_bulk_floats(container)):
+                        pass
+                    else:
+                        container.append(self._parse_scalar(token_type))
+            except _EndOfInput:
+                if not incremental:
+                    raise
+                # Roll back everything this iteration changed
+                self.pos = item_start
+                frame[1] = had_item
+                raise _Suspended(root, stack) from None
+        return root
 
     def parse_key(self) -> str:
         """Parse a key in an object."""
-        token = self.current_token()
-        if token.type in ('STRING', 'IDENTIFIER', 'AT_KEYWORD'):
-            key = token.value
+        token_type = self._current_type()
+        if token_type is _STRING:
+            # Decode quoted keys the same way as string values, so the
+            # result matches what json.loads produces for JSON input
+            return self.parse_string()
+        if token_type is _IDENTIFIER or token_type is _AT_KEYWORD:
+            key = self.values[self.pos].decode('utf-8')
             self.pos += 1
             return key
-        else:
-            raise SyntaxError(f"Unexpected token {token.type} in key at position {token.position}")
+        raise SyntaxError(
+            f"Unexpected token {token_type} in key at position {self.positions[self.pos]}")
 
     def parse_string(self) -> str:
         """Parse a string."""
-        token = self.consume_token('STRING')
-        string_content = token.value[1:-1]
+        value = self.values[self.pos]
+        self.pos += 1
+        string_content = value[1:-1]
+        if b'\\' not in string_content:
+            # Common case: nothing to decode
+            return string_content.decode('utf-8')
         return self._decode_string(string_content)
 
-    def parse_number(self) -> Union[int, float]:
-        """Parse a number."""
-        token = self.consume_token('NUMBER')
-        value = token.value
-        if '.' in value or 'e' in value or 'E' in value:
-            return float(value)
-        else:
-            return int(value)
-
-    def parse_constant(self) -> Any:
-        """Parse constants true, false, null."""
-        token = self.current_token()
-        if token.type == 'TRUE':
-            self.consume_token('TRUE')
-            return True
-        elif token.type == 'FALSE':
-            self.consume_token('FALSE')
-            return False
-        elif token.type == 'NULL':
-            self.consume_token('NULL')
-            return None
+    def parse_int(self) -> int:
+        """Parse an integer."""
+        value = self.values[self.pos]
+        self.pos += 1
+        return int(value)
+
+    def parse_float(self) -> float:
+        """Parse a float."""
+        value = self.values[self.pos]
+        self.pos += 1
+        return float(value)
 
     def parse_expression(self) -> str:
-        """Parse an expression."""
-        tokens = []
-        while self.pos < len(self.tokens):
-            token = self.current_token()
-            if token.type in ('COMMA', 'RBRACE', 'RBRACKET'):
-                break
-            tokens.append(token.value)
-            self.pos += 1
-        return ''.join(tokens)
+        """Parse an expression.
+
+        The result is a slice of the original source spanning the
+        expression's tokens, so interior whitespace is preserved and the
+        cost is one allocation instead of a join of every token value.
+        """
+        start = self.pos
+        memo_hit = self._expr_memo.get(start)
+        if memo_hit is not None:
+            result, self.pos = memo_hit
+            return result
+        # Hoist instance attributes to locals: the loop body then runs on
+        # LOAD_FAST instead of an attribute load+store per token
+        types = self.types
+        n = len(types)
+        pos = start
+        while pos < n and types[pos] not in _EXPRESSION_STOP:
+            pos += 1
+        self.pos = pos
+        if pos == start:
+            result = ''
+        elif self.buffer is not None:
+            begin = self.positions[start]
+            end = self.positions[pos - 1] + len(self.values[pos - 1])
+            result = self.buffer[begin:end].decode('utf-8')
+        else:
+            # No source buffer (tokens supplied directly): fall back to
+            # joining the token values
+            result = b''.join(self.values[start:pos]).decode('utf-8')
+        self._expr_memo[start] = (result, pos)
+        return result
 
     @staticmethod
-    def _decode_string(s: str) -> str:
+    def _decode_string(s: bytes) -> str:
         """Decode escape sequences in a string."""
-        return bytes(s, "utf-8").decode("unicode_escape")
+        return s.decode("unicode_escape")
 
-    def current_token(self) -> Token:
-        """Return the current token, skipping whitespace."""
-        while self.pos < len(self.tokens) and self.tokens[self.pos].type == 'WS':
-            self.pos += 1
-        if self.pos < len(self.tokens):
-            return self.tokens[self.pos]
+    def _current_type(self) -> str:
+        """Return the type of the current token."""
+        if self.pos < len(self.types):
+            return self.types[self.pos]
         else:
-            raise SyntaxError("Unexpected end of input")
+            raise _EndOfInput("Unexpected end of input")
 
-    def consume_token(self, expected_type: str = None) -> Token:
-        """Consume and return the current token, checking its type if specified."""
-        token = self.current_token()
-        if expected_type and token.type != expected_type:
-            raise SyntaxError(f"Expected {expected_type}, but got {token.type} at position {token.position}")
-        self.pos += 1
-        return token
+    def _describe_current(self) -> str:
+        """Describe the current token for error messages."""
+        if self.pos < len(self.types):
+            return f"{self.types[self.pos]} at position {self.positions[self.pos]}"
+        else:
+            return "end of input"
 
 def parse_dml(dml_string: str) -> Any:
     """Parse a DML string into a Python object."""
+    stripped = dml_string.lstrip()
+    if stripped[:1] == '{' and '@' not in stripped[:1024]:
+        # Probably a pure-JSON document; json.loads is a C-level parser
+        # that beats this one by a couple of orders of magnitude. Any
+        # DML extension it rejects (comments, expressions, trailing
+        # commas, @keywords past the probe window) falls through to the
+        # general path, as does nesting deep enough to blow json's
+        # recursive decoder -- the iterative parser handles any depth.
+        try:
+            return json.loads(dml_string)
+        except (ValueError, RecursionError):
+            pass
     lexer = Lexer(dml_string)
-    tokens = lexer.tokenize()
-    parser = Parser(tokens)
+    types, values, positions = lexer.tokenize()
+    parser = Parser(types, values, positions, lexer.buffer)
     return parser.parse()
 
+class IncrementalState:
+    """Resume state for parse_dml_incremental.
+
+    Tracks one growing document: the byte prefix already lexed, the
+    token arrays built from it, and where the parser suspended. Updated
+    in place on every call.
+    """
+
+    __slots__ = ('confirmed', 'lex_restart', 'types', 'values', 'positions',
+                 'mode', 'result', 'stack', 'resume_pos', 'done')
+
+    def __init__(self):
+        self.confirmed = b''
+        self.lex_restart = 0
+        self.types: List[str] = []
+        self.values: List[bytes] = []
+        self.positions: List[int] = []
+        self.mode = None  # 'object' | 'sections', decided on first token
+        self.result: Any = {}
+        self.stack: Union[List[List[Any]], None] = None
+        self.resume_pos = 0
+        self.done = False
+
+def parse_dml_incremental(dml_string: str,
+                          prev_state: IncrementalState = None) -> Tuple[Any, IncrementalState]:
+    """Parse a DML string, reusing the work of a previous call on a prefix.
+
+    Meant for streaming producers (an LLM emitting DML, an editor buffer)
+    that re-parse the same growing document: lexing resumes at the byte
+    offset where the previous call stopped and the parser resumes inside
+    the container it suspended in, so the tokenize and parse work per
+    call is proportional to the appended text. Each call still encodes
+    the full string and compares it against the confirmed prefix, which
+    the state retains a copy of, so a linear-in-document cost remains --
+    just a far cheaper one than re-lexing and re-parsing.
+
+    Returns (result, state); pass the state back in on the next call.
+    If the new string does not start with the previously parsed prefix,
+    the document is re-parsed from scratch. The result reflects the
+    parsed prefix only: trailing tokens that appended text could still
+    extend (an open string or expression, a number or identifier at the
+    very end) are held back until the text continues, so parse the
+    finished document with parse_dml for the exact final result.
+    """
+    buf = dml_string.encode('utf-8')
+    state = prev_state
+    if state is not None and not buf.startswith(state.confirmed):
+        state = None  # The prefix changed; start over
+    if state is None:
+        state = IncrementalState()
+    if state.done:
+        return state.result, state
+    types, values, positions = state.types, state.values, state.positions
+    prev_token_count = len(values)
+
+    # Lex only the appended suffix
+    first_skipped = _tokenize_into(buf, state.lex_restart, types, values, positions)
+
+    # Hold back tokens that more text could still change. cut is the
+    # first byte offset we are not yet confident about: a byte the lexer
+    # could not match (the start of an unterminated string, a lone '@')
+    # or an unclosed block comment, which lexes as '/' '*' operator
+    # tokens until its '*/' arrives.
+    cut = len(buf)
+    if first_skipped is not None:
+        cut = first_skipped
+    # An unclosed comment lexes as adjacent '/' '*' (or '/' '/') operator
+    # tokens until the rest of it arrives
+    for idx in range(max(prev_token_count - 1, 0), len(values) - 1):
+        if (values[idx] == b'/' and values[idx + 1] in (b'*', b'/')
+                and positions[idx + 1] == positions[idx] + 1):
+            cut = min(cut, positions[idx])
+            break
+    while positions and positions[-1] >= cut:
+        types.pop(); values.pop(); positions.pop()
+    if cut >= len(buf):
+        # Pop the trailing run of tokens that sits flush with the end of
+        # the buffer and could still re-tokenize as more text arrives
+        edge = len(buf)
+        while (types and types[-1] in _EXTENDABLE_TYPES
+                and positions[-1] + len(values[-1]) == edge):
+            edge = positions[-1]
+            types.pop(); values.pop(); positions.pop()
+    # Confirm up to the end of the last token kept: trailing whitespace
+    # and comments are re-scanned next call, so a comment that is still
+    # being written never gets split
+    if positions:
+        state.lex_restart = positions[-1] + len(values[-1])
+    else:
+        state.lex_restart = min(state.lex_restart, cut)
+    state.confirmed = buf[:state.lex_restart]
+
+    if not types:
+        return state.result, state
+    if state.mode is None:
+        state.mode = 'object' if types[0] is _LBRACE else 'sections'
+        state.resume_pos = 0
+
+    parser = Parser(types, values, positions, buf, incremental=True)
+    parser.pos = state.resume_pos
+
+    if state.mode == 'object':
+        try:
+            root = parser._parse_container(state.stack)
+            state.result = root
+            state.stack = None
+            state.done = True
+        except _Suspended as suspension:
+            state.result = suspension.root
+            state.stack = suspension.stack
+            state.resume_pos = parser.pos
+        return state.result, state
+
+    sections = state.result
+    if state.stack is not None:
+        # Finish the container the previous call suspended in; it is
+        # already attached under its key
+        try:
+            parser._parse_container(state.stack)
+            state.stack = None
+        except _Suspended as suspension:
+            state.stack = suspension.stack
+            state.resume_pos = parser.pos
+            return sections, state
+    while parser.pos < len(types):
+        section_start = parser.pos
+        token_type = types[parser.pos]
+        if not (token_type is _AT_KEYWORD or token_type is _IDENTIFIER):
+            raise SyntaxError(
+                f"Unexpected token {token_type} at position {positions[parser.pos]}")
+        key = values[parser.pos].decode('utf-8')
+        parser.pos += 1
+        if parser.pos >= len(types):
+            # The colon has not arrived yet
+            parser.pos = section_start
+            break
+        if types[parser.pos] is not _COLON:
+            raise SyntaxError(
+                f"Expected ':' after key '{key}', but got {parser._describe_current()}")
+        parser.pos += 1
+        try:
+            sections[key] = parser.parse_value()
+        except _Suspended as suspension:
+            sections[key] = suspension.root
+            state.stack = suspension.stack
+            state.resume_pos = parser.pos
+            return sections, state
+        except _EndOfInput:
+            parser.pos = section_start
+            break
+    state.resume_pos = parser.pos
+    return sections, state
+
 def parse_dml_file(file_path: str) -> Any:
     """Parse DML content from a file into a Python object."""
     with open(file_path, 'r', encoding='utf-8') as file: